@@ -1,10 +1,10 @@
 import collections
 import os
 
-import aesara.tensor as tt
 import numpy as np
 import pandas as pd
 import pymc as pm
+import pytensor.tensor as pt
 from scipy.stats import poisson
 
 from .football_probability_grid import FootballProbabilityGrid
@@ -206,16 +206,16 @@ class BayesianBivariateGoalModel:
             eta = pm.Flat("eta")
 
             # apply sum zero constraints
-            atts = pm.Deterministic("atts", atts_star - tt.mean(atts_star))
-            defs = pm.Deterministic("defs", def_star - tt.mean(def_star))
+            atts = pm.Deterministic("atts", atts_star - pt.mean(atts_star))
+            defs = pm.Deterministic("defs", def_star - pt.mean(def_star))
 
             # calulate theta
-            lambda1 = tt.exp(mu + eta + atts[home_team] + defs[away_team])
-            lambda2 = tt.exp(mu + atts[away_team] + defs[home_team])
-            lambda3 = tt.exp(rho[home_team] + rho[away_team])
+            lambda1 = pt.exp(mu + eta + atts[home_team] + defs[away_team])
+            lambda2 = pt.exp(mu + atts[away_team] + defs[home_team])
+            lambda3 = pt.exp(rho[home_team] + rho[away_team])
 
             # weights
-            weights = pm.Data("weights", self.fixtures["weights"].values, mutable=False)
+            weights = pm.Data("weights", self.fixtures["weights"].values)
 
             # goal expectation
             pm.Potential(
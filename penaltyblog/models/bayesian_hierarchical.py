@@ -1,14 +1,87 @@
 import collections
+import functools
 import os
 
-import aesara.tensor as tt
 import numpy as np
 import pandas as pd
 import pymc as pm
-from scipy.stats import poisson
+import pytensor.tensor as pt
 
 from .football_probability_grid import FootballProbabilityGrid
 
+SAMPLERS = ("advi", "pymc", "nutpie", "numpyro")
+
+
+@functools.lru_cache(maxsize=None)
+def _log_factorial(max_goals):
+    """
+    Internal function returning log(k!) for k in 0..max_goals - 1,
+    cached as the same few values of `max_goals` get used over and over
+    """
+    log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, max_goals)))])
+    log_fact.setflags(write=False)
+    return log_fact
+
+
+def _poisson_pmf(mu, max_goals):
+    """
+    Internal function calculating the poisson pmf for 0..max_goals - 1 goals,
+    vectorised over the last axis for an array of goal expectancies
+    """
+    mu = np.asarray(mu, dtype=np.float64)[..., None]
+    k = np.arange(max_goals)
+    return np.exp(-mu + k * np.log(mu) - _log_factorial(max_goals))
+
+
+def _build_model(goals_home, goals_away, home_team, away_team, n_teams, weights=None):
+    """
+    Internal function building the model graph for a set of fixtures. The
+    observed data are baked into the graph as constants so pytensor can fold
+    the indexing. Without weights the likelihood skips multiplying by them
+    """
+    with pm.Model() as model:
+        # flat parameters
+        home = pm.Flat("home")
+        intercept = pm.Flat("intercept")
+
+        # attack parameters
+        tau_att = pm.Gamma("tau_att", 0.1, 0.1)
+        atts_star = pm.Normal("atts_star", mu=0, tau=tau_att, shape=n_teams)
+
+        # defence parameters
+        tau_def = pm.Gamma("tau_def", 0.1, 0.1)
+        def_star = pm.Normal("def_star", mu=0, tau=tau_def, shape=n_teams)
+
+        # apply sum zero constraints
+        atts = pm.Deterministic("atts", atts_star - pt.mean(atts_star))
+        defs = pm.Deterministic("defs", def_star - pt.mean(def_star))
+
+        # calulate log theta, the poisson log likelihood is written on it
+        # directly so theta is never exp'd and then logged again, and
+        # gammaln of the observed goals folds to a constant
+        home_log_theta = intercept + home + atts[home_team] + defs[away_team]
+        away_log_theta = intercept + atts[away_team] + defs[home_team]
+
+        home_ll = (
+            goals_home * home_log_theta
+            - pt.exp(home_log_theta)
+            - pt.gammaln(goals_home + 1)
+        )
+        away_ll = (
+            goals_away * away_log_theta
+            - pt.exp(away_log_theta)
+            - pt.gammaln(goals_away + 1)
+        )
+
+        if weights is not None:
+            home_ll = weights * home_ll
+            away_ll = weights * away_ll
+
+        pm.Potential("home_goals", home_ll.sum())
+        pm.Potential("away_goals", away_ll.sum())
+
+    return model
+
 
 class BayesianHierarchicalGoalModel:
     """Bayesian Hierarchical model for predicting outcomes of football
@@ -25,6 +98,9 @@ class BayesianHierarchicalGoalModel:
         predict the outcome of a football (soccer) game between the home_team and
         away_team
 
+    predict_many(home_teams, away_teams, max_goals=15)
+        predict the outcomes of a list of football (soccer) games in one pass
+
     get_params()
         Returns the fitted parameters from the model
     """
@@ -38,6 +114,7 @@ class BayesianHierarchicalGoalModel:
         weights=1,
         n_jobs=None,
         draws=2500,
+        sampler="advi",
     ):
         """
         Parameters
@@ -57,48 +134,63 @@ class BayesianHierarchicalGoalModel:
         n_jobs : int or None
             Number of chains to run in parallel
         draws : int
-            Number of samples to draw from the model
+            Number of samples to draw from the model. For `advi` this is the
+            total number of samples drawn from the fitted approximation, for the
+            NUTS samplers it is split evenly across the `n_jobs` chains
+        sampler : str
+            Method used to approximate the posterior. `advi` uses variational
+            inference (fastest), while `pymc`, `nutpie` and `numpyro` run NUTS
+            using that library's sampler. `nutpie` requires `pip install nutpie`
+            and `numpyro` requires `pip install numpyro` plus a working JAX install
         """
-        self.fixtures = pd.DataFrame([goals_home, goals_away, teams_home, teams_away]).T
-        self.fixtures.columns = ["goals_home", "goals_away", "team_home", "team_away"]
-        self.fixtures["goals_home"] = self.fixtures["goals_home"].astype(int)
-        self.fixtures["goals_away"] = self.fixtures["goals_away"].astype(int)
-        self.fixtures["weights"] = weights
-        self.fixtures = self.fixtures.reset_index(drop=True)
-
-        self.n_teams = len(self.fixtures["team_home"].unique())
-
-        self.teams = (
-            self.fixtures[["team_home"]]
-            .drop_duplicates()
-            .sort_values("team_home")
-            .reset_index(drop=True)
-            .assign(team_index=np.arange(self.n_teams))
-            .rename(columns={"team_home": "team"})
+        if sampler not in SAMPLERS:
+            raise ValueError(
+                "sampler must be one of `advi`, `pymc`, `nutpie` or `numpyro`"
+            )
+
+        self.fixtures = pd.DataFrame(
+            {
+                "goals_home": np.asarray(goals_home, dtype=np.int64),
+                "goals_away": np.asarray(goals_away, dtype=np.int64),
+                "team_home": np.asarray(teams_home),
+                "team_away": np.asarray(teams_away),
+                "weights": (
+                    np.asarray(weights, dtype=np.float64)
+                    if hasattr(weights, "__len__")
+                    else np.full(len(goals_home), weights, dtype=np.float64)
+                ),
+            }
         )
 
-        self.fixtures = (
-            self.fixtures.merge(
-                self.teams,
-                left_on="team_home",
-                right_on="team",
-                how="left",
-            )
-            .rename(columns={"team_index": "home_index"})
-            .drop(["team"], axis=1)
-            .merge(
-                self.teams,
-                left_on="team_away",
-                right_on="team",
-                how="left",
-            )
-            .rename(columns={"team_index": "away_index"})
-            .drop(["team"], axis=1)
+        # the default scalar weight of 1 lets the likelihood skip the weights
+        self._uniform_weights = bool(np.isscalar(weights) and weights == 1)
+
+        # factorize home and away teams together so teams that only
+        # appear as the away side still get an index
+        all_teams = pd.concat(
+            [self.fixtures["team_home"], self.fixtures["team_away"]],
+            ignore_index=True,
+        )
+        codes, uniques = pd.factorize(all_teams, sort=True)
+        n_fixtures = len(self.fixtures)
+        self.fixtures["home_index"] = codes[:n_fixtures].astype(np.int32)
+        self.fixtures["away_index"] = codes[n_fixtures:].astype(np.int32)
+
+        self.n_teams = len(uniques)
+        self.teams = pd.DataFrame(
+            {
+                "team": uniques,
+                "team_index": np.arange(self.n_teams),
+            }
         )
 
         self.trace = None
         self.draws = draws
+        self.sampler = sampler
         self.params = dict()
+        self._atts = None
+        self._defs = None
+        self._team_to_idx = dict()
 
         if n_jobs == -1 or n_jobs is None:
             self.n_jobs = os.cpu_count()
@@ -131,24 +223,9 @@ class BayesianHierarchicalGoalModel:
         repr_str += "-" * 60
         repr_str += "\n"
 
-        attack = [None] * self.n_teams
-        defence = [None] * self.n_teams
-        team = self.teams["team"].tolist()
-
-        for k, v in self.params.items():
-            if "_" not in k:
-                continue
-
-            p = k.split("_")[0]
-            t = k.split("_")[1]  # noqa
-            if p == "attack":
-                idx = self.teams.query("team == @t").iloc[0]["team_index"]
-                attack[idx] = round(v, 3)
-            elif p == "defence":
-                idx = self.teams.query("team == @t").iloc[0]["team_index"]
-                defence[idx] = round(v, 3)
-            else:
-                continue
+        attack = [round(v, 3) for v in self._atts]
+        defence = [round(v, 3) for v in self._defs]
+        team = list(self._team_to_idx)
 
         for obj in zip(team, attack, defence):
             repr_str += "{0: <20} {1:<20} {2:<20}".format(
@@ -178,61 +255,61 @@ class BayesianHierarchicalGoalModel:
         Fits the model to the data and calculates the team strengths,
         home advantage and intercept. Should be called before `predict` can be used
         """
-        goals_home_obs = self.fixtures["goals_home"].values
-        goals_away_obs = self.fixtures["goals_away"].values
-
-        home_team = self.fixtures["home_index"].values
-        away_team = self.fixtures["away_index"].values
-
-        with pm.Model():
-            # flat parameters
-            home = pm.Flat("home")
-            intercept = pm.Flat("intercept")
-
-            # attack parameters
-            tau_att = pm.Gamma("tau_att", 0.1, 0.1)
-            atts_star = pm.Normal("atts_star", mu=0, tau=tau_att, shape=self.n_teams)
-
-            # defence parameters
-            tau_def = pm.Gamma("tau_def", 0.1, 0.1)
-            def_star = pm.Normal("def_star", mu=0, tau=tau_def, shape=self.n_teams)
-
-            # apply sum zero constraints
-            atts = pm.Deterministic("atts", atts_star - tt.mean(atts_star))
-            defs = pm.Deterministic("defs", def_star - tt.mean(def_star))
-
-            # calulate theta
-            home_theta = tt.exp(intercept + home + atts[home_team] + defs[away_team])
-            away_theta = tt.exp(intercept + atts[away_team] + defs[home_team])
-
-            # weights
-            weights = pm.Data("weights", self.fixtures["weights"], mutable=False)
-
-            pm.Potential(
-                "home_goals",
-                weights * pm.logp(pm.Poisson.dist(mu=home_theta), goals_home_obs),
-            )
-            pm.Potential(
-                "away_goals",
-                weights * pm.logp(pm.Poisson.dist(mu=away_theta), goals_away_obs),
-            )
-
-            self.trace = pm.sample(
-                int(self.draws / self.n_jobs),
-                tune=2000,
-                cores=self.n_jobs,
-                return_inferencedata=False,
-            )
+        goals_home_obs = self.fixtures["goals_home"].to_numpy(np.int64)
+        goals_away_obs = self.fixtures["goals_away"].to_numpy(np.int64)
+
+        # team indices are int32 to halve the gather traffic when indexing
+        home_team = self.fixtures["home_index"].to_numpy(np.int32)
+        away_team = self.fixtures["away_index"].to_numpy(np.int32)
+
+        weights = None
+        if not self._uniform_weights:
+            weights = self.fixtures["weights"].to_numpy(np.float64)
+
+        with _build_model(
+            goals_home_obs,
+            goals_away_obs,
+            home_team,
+            away_team,
+            self.n_teams,
+            weights,
+        ):
+            if self.sampler == "advi":
+                approx = pm.fit(
+                    n=30000,
+                    method="advi",
+                    obj_optimizer=pm.adam(learning_rate=0.05),
+                )
+                self.trace = approx.sample(self.draws)
+            else:
+                # compile pymc's own sampler with numba rather than C
+                compile_kwargs = None
+                if self.sampler == "pymc":
+                    compile_kwargs = {"mode": "NUMBA"}
+
+                self.trace = pm.sample(
+                    int(self.draws / self.n_jobs),
+                    tune=2000,
+                    cores=self.n_jobs,
+                    nuts_sampler=self.sampler,
+                    compile_kwargs=compile_kwargs,
+                )
 
-        self.params["home_advantage"] = np.mean(self.trace["home"])
-        self.params["intercept"] = np.mean(self.trace["intercept"])
-        for idx, row in self.teams.iterrows():
-            self.params["attack_" + row["team"]] = np.mean(
-                [x[idx] for x in self.trace["atts"]]
-            )
-            self.params["defence_" + row["team"]] = np.mean(
-                [x[idx] for x in self.trace["defs"]]
-            )
+        # team strengths are stored as arrays indexed by team_index, the
+        # float64 draws are averaged directly without copying the trace
+        posterior = self.trace.posterior
+        self._atts = np.asarray(posterior["atts"]).mean(axis=(0, 1))
+        self._defs = np.asarray(posterior["defs"]).mean(axis=(0, 1))
+        self._team_to_idx = dict(zip(self.teams["team"], range(self.n_teams)))
+
+        self.params["home_advantage"] = float(posterior["home"].mean())
+        self.params["intercept"] = float(posterior["intercept"].mean())
+        self.params.update(
+            {f"attack_{t}": self._atts[i] for t, i in self._team_to_idx.items()}
+        )
+        self.params.update(
+            {f"defence_{t}": self._defs[i] for t, i in self._team_to_idx.items()}
+        )
 
         self.fitted = True
 
@@ -272,10 +349,7 @@ class BayesianHierarchicalGoalModel:
         elif isinstance(home_team, collections.abc.Sequence) and isinstance(
             away_team, collections.abc.Sequence
         ):
-            results = [
-                self._predict(x[0], x[1], max_goals) for x in zip(home_team, away_team)
-            ]
-            return results
+            return self.predict_many(home_team, away_team, max_goals)
 
         else:
             raise ValueError("Team data types not recognised")
@@ -304,7 +378,7 @@ class BayesianHierarchicalGoalModel:
         """
 
         # check we have parameters for teams
-        if home_team not in self.teams["team"].tolist():
+        if home_team not in self._team_to_idx:
             raise ValueError(
                 (
                     "No parameters for home team - "
@@ -312,7 +386,7 @@ class BayesianHierarchicalGoalModel:
                 )
             )
 
-        if away_team not in self.teams["team"].tolist():
+        if away_team not in self._team_to_idx:
             raise ValueError(
                 (
                     "No parameters for away team - "
@@ -323,16 +397,19 @@ class BayesianHierarchicalGoalModel:
         # get the parameters
         home = self.params["home_advantage"]
         intercept = self.params["intercept"]
-        atts_home = self.params["attack_" + home_team]
-        atts_away = self.params["attack_" + away_team]
-        defs_home = self.params["defence_" + home_team]
-        defs_away = self.params["defence_" + away_team]
+        hi = self._team_to_idx[home_team]
+        ai = self._team_to_idx[away_team]
+        atts_home = self._atts[hi]
+        atts_away = self._atts[ai]
+        defs_home = self._defs[hi]
+        defs_away = self._defs[ai]
 
         # calculate the goal vectors
         home_goals = np.exp(intercept + home + atts_home + defs_away)
         away_goals = np.exp(intercept + atts_away + defs_home)
-        home_goals_vector = poisson(home_goals).pmf(np.arange(0, max_goals))
-        away_goals_vector = poisson(away_goals).pmf(np.arange(0, max_goals))
+        home_goals_vector, away_goals_vector = _poisson_pmf(
+            [home_goals, away_goals], max_goals
+        )
 
         # get the probabilities for each possible score
         m = np.outer(home_goals_vector, away_goals_vector)
@@ -340,6 +417,80 @@ class BayesianHierarchicalGoalModel:
         probability_grid = FootballProbabilityGrid(m, home_goals, away_goals)
         return probability_grid
 
+    def predict_many(self, home_teams, away_teams, max_goals=15) -> list:
+        """
+        Predicts the probabilities of the different possible match outcomes
+        for a list of fixtures, vectorised across all the fixtures at once
+
+        Parameters
+        ----------
+        home_teams : list
+            A list or pd.Series of home team names, must have been in the data
+            the model was fitted on
+
+        away_teams : list
+            A list or pd.Series of away team names, must have been in the data
+            the model was fitted on
+
+        max_goals : int
+            The maximum number of goals to calculate the probabilities over.
+            Reducing this will improve performance slightly at the expensive of acuuracy
+
+        Returns
+        -------
+        list
+            A list of FootballProbabilityGrid, one per fixture
+        """
+        if not self.fitted:
+            raise ValueError(
+                (
+                    "Model's parameters have not been fit yet, please call the `fit()` "
+                    "function before making any predictions"
+                )
+            )
+
+        team_index = pd.Index(list(self._team_to_idx))
+        home_idx = team_index.get_indexer(list(home_teams))
+        away_idx = team_index.get_indexer(list(away_teams))
+
+        # check we have parameters for teams
+        if (home_idx == -1).any():
+            raise ValueError(
+                (
+                    "No parameters for home team - "
+                    "please ensure the team was included in the training data"
+                )
+            )
+
+        if (away_idx == -1).any():
+            raise ValueError(
+                (
+                    "No parameters for away team - "
+                    "please ensure the team was included in the training data"
+                )
+            )
+
+        # get the parameters
+        home = self.params["home_advantage"]
+        intercept = self.params["intercept"]
+        atts = self._atts
+        defs = self._defs
+
+        # calculate the goal vectors
+        home_goals = np.exp(intercept + home + atts[home_idx] + defs[away_idx])
+        away_goals = np.exp(intercept + atts[away_idx] + defs[home_idx])
+        home_goals_vectors, away_goals_vectors = _poisson_pmf(
+            [home_goals, away_goals], max_goals
+        )
+
+        # get the probabilities for each possible score
+        grids = home_goals_vectors[:, :, None] * away_goals_vectors[:, None, :]
+
+        return [
+            FootballProbabilityGrid(m, hg, ag)
+            for m, hg, ag in zip(grids, home_goals, away_goals)
+        ]
+
     def get_params(self) -> dict:
         """
         Provides access to the model's fitted parameters
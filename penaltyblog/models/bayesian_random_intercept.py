@@ -1,10 +1,10 @@
 import collections
 import os
 
-import aesara.tensor as tt
 import numpy as np
 import pandas as pd
 import pymc as pm
+import pytensor.tensor as pt
 from scipy.stats import poisson
 
 from .football_probability_grid import FootballProbabilityGrid
@@ -209,19 +209,19 @@ class BayesianRandomInterceptGoalModel:
             def_star = pm.Normal("def_star", mu=0, tau=tau_def, shape=self.n_teams)
 
             # apply sum zero constraints
-            atts = pm.Deterministic("atts", atts_star - tt.mean(atts_star))
-            defs = pm.Deterministic("defs", def_star - tt.mean(def_star))
+            atts = pm.Deterministic("atts", atts_star - pt.mean(atts_star))
+            defs = pm.Deterministic("defs", def_star - pt.mean(def_star))
 
             # calulate theta
-            home_theta = tt.exp(
+            home_theta = pt.exp(
                 intercept[home_team] + home + atts[home_team] + defs[away_team]
             )
-            away_theta = tt.exp(
+            away_theta = pt.exp(
                 intercept[away_team] + atts[away_team] + defs[home_team]
             )
 
             # weights
-            weights = pm.Data("weights", self.fixtures["weights"], mutable=False)
+            weights = pm.Data("weights", self.fixtures["weights"])
 
             pm.Potential(
                 "home_goals",
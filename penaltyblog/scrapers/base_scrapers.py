@@ -2,6 +2,7 @@ from typing import Iterable
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver import FirefoxOptions
 from webdriver_manager.firefox import GeckoDriverManager
@@ -115,10 +116,18 @@ class RequestsScraper(BaseScraper):
 
         self.cookies = None
 
+        # share one connection pool across requests, sized for concurrent fetches
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         super().__init__(team_mappings=team_mappings)
 
     def get(self, url: str):
         if self.cookies is not None:
-            return requests.get(url, headers=self.headers, cookies=self.cookies).text
+            return self.session.get(
+                url, headers=self.headers, cookies=self.cookies
+            ).text
         else:
-            return requests.get(url, headers=self.headers).text
+            return self.session.get(url, headers=self.headers).text
@@ -1,6 +1,6 @@
 import calendar
-import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import numpy as np
@@ -9,6 +9,22 @@ import pandas as pd
 from .base_scrapers import RequestsScraper
 from .common import COMPETITION_MAPPINGS, create_game_id, sanitize_columns
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+FIXTURE_COLUMNS = [
+    "espn_id",
+    "datetime",
+    "attendance",
+    "team_home",
+    "team_away",
+    "goals_home",
+    "goals_away",
+]
+
 
 class ESPN(RequestsScraper):
     """
@@ -93,14 +109,16 @@ class ESPN(RequestsScraper):
             "shot_assists_home": int,
             "shot_assists_away": int,
         }
-        for k, v in mappings.items():
-            df[k] = df[k].astype(v)
+        mappings = {k: v for k, v in mappings.items() if k in df.columns}
+        df = df.astype(mappings)
 
         return df
 
     def _convert_date(self, df):
-        df["datetime"] = pd.to_datetime(df["datetime"])
-        df["date"] = df["datetime"].dt.date
+        df["datetime"] = pd.to_datetime(
+            df["datetime"], format="%Y-%m-%dT%H:%MZ", utc=True, cache=True
+        )
+        df["date"] = df["datetime"].values.astype("datetime64[D]")
         return df
 
     def get_fixtures(self) -> pd.DataFrame:
@@ -114,23 +132,26 @@ class ESPN(RequestsScraper):
         )
 
         content = self.get(url)
-        content = json.loads(content)
+        content = _json.loads(content)
         fixture_dates = content["leagues"][0]["calendar"]
 
-        fixtures = list()
-        for date in fixture_dates:
-
-            url = self.base_url.format(
+        urls = [
+            self.base_url.format(
                 date=datetime.strptime(date, "%Y-%m-%dT%H:%MZ").strftime("%Y%m%d"),
                 competition=self.mapped_competition,
             )
-            content = self.get(url)
-            content = json.loads(content)
-            events = self._scrape_fixture_events(content)
-            fixtures.extend(events)
+            for date in fixture_dates
+        ]
 
-        df = pd.DataFrame(fixtures)
-        df["datetime"] = pd.to_datetime(df["datetime"])
+        # the requests are I/O bound so fetch the fixture dates concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contents = list(executor.map(self.get, urls))
+
+        columns = None
+        for content in contents:
+            columns = self._scrape_fixture_events(_json.loads(content), columns)
+
+        df = pd.DataFrame(columns)
         df = (
             df.pipe(sanitize_columns)
             .assign(season=self.season)
@@ -160,7 +181,7 @@ class ESPN(RequestsScraper):
         )
 
         content = self.get(url)
-        content = json.loads(content)
+        content = _json.loads(content)
 
         output = list()
         for roster in content["rosters"]:
@@ -232,7 +253,7 @@ class ESPN(RequestsScraper):
         )
 
         content = self.get(url)
-        content = json.loads(content)
+        content = _json.loads(content)
 
         output = list()
         for team in content["boxscore"]["teams"]:
@@ -271,32 +292,55 @@ class ESPN(RequestsScraper):
 
         return df
 
-    def _scrape_fixture_events(self, content) -> list:
+    def _scrape_fixture_events(self, content, columns=None) -> dict:
         """
         Internal method to extract the relevant info about the fixtures from the JSON
+        into a dict of columns, padding any stats missing for a fixture with None
+
+        Parameters
+        ----------
+        content : dict
+            the parsed JSON for a scoreboard page
+
+        columns : dict or None
+            dict of columns from previous pages to append the fixtures to
         """
-        events = list()
+        if columns is None:
+            columns = {k: [] for k in FIXTURE_COLUMNS}
 
         for e in content.get("events", []):
-            tmp = dict()
-            tmp["espn_id"] = e["competitions"][0].get("id")
-            tmp["datetime"] = e["competitions"][0].get("date")
-            tmp["attendance"] = e["competitions"][0].get("attendance")
-            tmp["team_home"] = e["competitions"][0]["competitors"][0]["team"].get(
-                "name"
-            )
-            tmp["team_away"] = e["competitions"][0]["competitors"][1]["team"].get(
-                "name"
-            )
-            tmp["goals_home"] = e["competitions"][0]["competitors"][0].get("score")
-            tmp["goals_away"] = e["competitions"][0]["competitors"][1].get("score")
+            n_rows = len(columns["espn_id"])
+            for k, v in self._build_fixture_event(e).items():
+                if k not in columns:
+                    columns[k] = [None] * n_rows
+                columns[k].append(v)
+
+            for col in columns.values():
+                if len(col) == n_rows:
+                    col.append(None)
+
+        return columns
+
+    def _build_fixture_event(self, e) -> dict:
+        """
+        Internal method to extract the relevant info about a single fixture
+        """
+        comp = e["competitions"][0]
+        home_c, away_c = comp["competitors"][:2]
 
-            for stat in e["competitions"][0]["competitors"][0]["statistics"]:
-                tmp[stat["name"] + "_home"] = stat["displayValue"]
+        tmp = dict()
+        tmp["espn_id"] = comp.get("id")
+        tmp["datetime"] = comp.get("date")
+        tmp["attendance"] = comp.get("attendance")
+        tmp["team_home"] = home_c["team"].get("name")
+        tmp["team_away"] = away_c["team"].get("name")
+        tmp["goals_home"] = home_c.get("score")
+        tmp["goals_away"] = away_c.get("score")
 
-            for stat in e["competitions"][0]["competitors"][1]["statistics"]:
-                tmp[stat["name"] + "_away"] = stat["displayValue"]
+        for stat in home_c["statistics"]:
+            tmp[stat["name"] + "_home"] = stat["displayValue"]
 
-            events.append(tmp)
+        for stat in away_c["statistics"]:
+            tmp[stat["name"] + "_away"] = stat["displayValue"]
 
-        return events
+        return tmp
@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
 import pytest
+from scipy.stats import poisson
 
 import penaltyblog as pb
+from penaltyblog.models.bayesian_hierarchical import _build_model, _poisson_pmf
 
 
 def test_model():
@@ -40,6 +43,13 @@ def test_model():
     assert 0.25 < probs[0].asian_handicap("home", 1.5) < 0.5
     assert 0.25 < probs[0].both_teams_to_score < 0.5
 
+    probs = clf.predict_many(df["team_home"], df["team_away"])
+    assert type(probs) == list
+    assert len(probs) == len(df)
+    assert type(probs[0]) == pb.models.FootballProbabilityGrid
+    single = clf.predict(df["team_home"].iloc[0], df["team_away"].iloc[0])
+    assert probs[0].home_draw_away == pytest.approx(single.home_draw_away)
+
 
 def test_unfitted_raises_error():
     fb = pb.scrapers.FootballData("ENG Premier League", "2019-2020")
@@ -55,6 +65,20 @@ def test_unfitted_raises_error():
         clf.get_params()
 
 
+def test_invalid_sampler_raises_error():
+    fb = pb.scrapers.FootballData("ENG Premier League", "2019-2020")
+    df = fb.get_fixtures()
+
+    with pytest.raises(ValueError):
+        pb.models.BayesianHierarchicalGoalModel(
+            df["goals_home"],
+            df["goals_away"],
+            df["team_home"],
+            df["team_away"],
+            sampler="metropolis",
+        )
+
+
 def test_unfitted_repr():
     fb = pb.scrapers.FootballData("ENG Premier League", "2019-2020")
     df = fb.get_fixtures()
@@ -64,3 +88,71 @@ def test_unfitted_repr():
 
     repr = str(clf)
     assert "Status: Model not fitted" in repr
+
+
+def test_poisson_pmf_matches_scipy():
+    home_goals_vector, away_goals_vector = _poisson_pmf([1.3, 0.4], 10)
+
+    assert home_goals_vector == pytest.approx(poisson.pmf(np.arange(10), 1.3))
+    assert away_goals_vector == pytest.approx(poisson.pmf(np.arange(10), 0.4))
+
+
+def test_away_only_team_indexed():
+    clf = pb.models.BayesianHierarchicalGoalModel(
+        [1, 2, 0],
+        [0, 1, 1],
+        ["Arsenal", "Chelsea", "Arsenal"],
+        ["Chelsea", "Arsenal", "Wolves"],
+    )
+
+    assert clf.n_teams == 3
+    assert clf.teams["team"].tolist() == ["Arsenal", "Chelsea", "Wolves"]
+    assert clf.fixtures["home_index"].tolist() == [0, 1, 0]
+    assert clf.fixtures["away_index"].tolist() == [1, 0, 2]
+
+
+@pytest.mark.parametrize("mode", [None, "NUMBA", "JAX"])
+def test_uniform_weights_match_unit_weights(mode):
+    if mode == "JAX":
+        pytest.importorskip("jax")
+
+    goals_home = np.array([1, 2, 0, 3, 1], dtype=np.int64)
+    goals_away = np.array([0, 1, 1, 2, 4], dtype=np.int64)
+    home_team = np.array([0, 1, 0, 2, 1], dtype=np.int32)
+    away_team = np.array([1, 0, 2, 1, 2], dtype=np.int32)
+
+    uniform = _build_model(goals_home, goals_away, home_team, away_team, 3)
+    weighted = _build_model(goals_home, goals_away, home_team, away_team, 3, np.ones(5))
+
+    rng = np.random.default_rng(42)
+    point = {k: rng.normal(size=v.shape) for k, v in uniform.initial_point().items()}
+
+    uniform_logp = uniform.compile_logp(mode=mode)(point)
+    weighted_logp = weighted.compile_logp(mode=mode)(point)
+    assert uniform_logp == pytest.approx(weighted_logp)
+
+
+def test_log_theta_likelihood_matches_scipy():
+    goals_home = np.array([1, 2, 0, 3, 1], dtype=np.int64)
+    goals_away = np.array([0, 1, 1, 2, 4], dtype=np.int64)
+    home_team = np.array([0, 1, 0, 2, 1], dtype=np.int32)
+    away_team = np.array([1, 0, 2, 1, 2], dtype=np.int32)
+
+    model = _build_model(goals_home, goals_away, home_team, away_team, 3)
+
+    rng = np.random.default_rng(42)
+    point = {k: rng.normal(size=v.shape) for k, v in model.initial_point().items()}
+    home_ll, away_ll = model.compile_fn(
+        model.logp(vars=[model["home_goals"], model["away_goals"]], sum=False),
+        inputs=model.value_vars,
+        on_unused_input="ignore",
+    )(point)
+
+    atts = point["atts_star"] - point["atts_star"].mean()
+    defs = point["def_star"] - point["def_star"].mean()
+    home_theta = np.exp(
+        point["intercept"] + point["home"] + atts[home_team] + defs[away_team]
+    )
+    away_theta = np.exp(point["intercept"] + atts[away_team] + defs[home_team])
+    assert home_ll == pytest.approx(poisson.logpmf(goals_home, home_theta).sum())
+    assert away_ll == pytest.approx(poisson.logpmf(goals_away, away_theta).sum())